@@ -37,23 +37,31 @@ SessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
+# Set once init_db() has run so repeated calls skip the DDL checks
+_initialized = False
+
 def init_db():
-    """Initialize database and create all tables"""
+    """Initialize database and create all tables (runs once per process)"""
+    global _initialized
+    if _initialized:
+        return
+    
     try:
         logger.info("Initializing database...")
-        SQLModel.metadata.create_all(engine)
+        SQLModel.metadata.create_all(engine, checkfirst=True)
         
         # Insert default grid nodes if they don't exist
         from .models import GridNode
-        from sqlmodel import select
+        from sqlmodel import func, select
         with Session(engine) as session:
-            existing_nodes = len(session.exec(select(GridNode)).all())
+            existing_nodes = session.exec(select(func.count()).select_from(GridNode)).one()
             if existing_nodes == 0:
                 logger.info("Inserting default grid nodes...")
                 from .models import insert_sample_nodes
                 insert_sample_nodes(session)
                 logger.info("Default grid nodes inserted successfully")
         
+        _initialized = True
         logger.info("Database initialized successfully")
         
     except Exception as e:
@@ -83,12 +91,15 @@ def check_database_health() -> dict:
             
             # Count tables
             from .models import GridNode, TradingOrder, DayAheadPrice, RealTimePrice
-            from sqlmodel import select
+            from sqlmodel import func, select
+            
+            def count(model):
+                return session.exec(select(func.count()).select_from(model)).one()
             
-            node_count = len(session.exec(select(GridNode)).all())
-            order_count = len(session.exec(select(TradingOrder)).all())
-            da_price_count = len(session.exec(select(DayAheadPrice)).all())
-            rt_price_count = len(session.exec(select(RealTimePrice)).all())
+            node_count = count(GridNode)
+            order_count = count(TradingOrder)
+            da_price_count = count(DayAheadPrice)
+            rt_price_count = count(RealTimePrice)
             
             return {
                 "status": "healthy",
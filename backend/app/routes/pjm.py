@@ -2,7 +2,7 @@
 # New API routes for PJM watchlist functionality
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 from datetime import datetime, timedelta
 from typing import Optional, List
 from pydantic import BaseModel, Field
@@ -501,24 +501,29 @@ async def get_pjm_system_status(
     """
     try:
         # Count nodes
-        total_nodes = len(session.exec(select(PJMNode)).all())
-        active_nodes = len(session.exec(select(PJMNode).where(PJMNode.is_active == True)).all())
+        total_nodes = session.exec(select(func.count()).select_from(PJMNode)).one()
+        active_nodes = session.exec(
+            select(func.count()).select_from(PJMNode).where(PJMNode.is_active == True)
+        ).one()
         
         # Count watchlists
-        total_watchlist_items = len(session.exec(select(WatchlistItem)).all())
-        unique_users = len(session.exec(select(WatchlistItem.user_id).distinct()).all())
+        total_watchlist_items = session.exec(select(func.count()).select_from(WatchlistItem)).one()
+        # Count the DISTINCT rows rather than COUNT(DISTINCT user_id), which would skip a NULL user
+        unique_users = session.exec(
+            select(func.count()).select_from(select(WatchlistItem.user_id).distinct().subquery())
+        ).one()
         
         # Count alerts
-        active_alerts = len(session.exec(
-            select(PriceAlert).where(PriceAlert.status == AlertStatus.ACTIVE)
-        ).all())
+        active_alerts = session.exec(
+            select(func.count()).select_from(PriceAlert).where(PriceAlert.status == AlertStatus.ACTIVE)
+        ).one()
         
         # Recent price updates
-        recent_updates = len(session.exec(
-            select(NodePriceSnapshot).where(
+        recent_updates = session.exec(
+            select(func.count()).select_from(NodePriceSnapshot).where(
                 NodePriceSnapshot.timestamp_utc >= datetime.utcnow() - timedelta(minutes=10)
             )
-        ).all())
+        ).one()
         
         return {
             "system_status": "operational",
@@ -680,13 +685,31 @@ async def validate_pjm_compliance(
             "api_endpoints": {
                 "pjm_compliant_pnl": "/api/pjm/compliance/pnl/{pnode_id}",
                 "settlement_summary": "/api/pjm/compliance/settlement-summary/{pnode_id}",
-                "data_quality_status": "/api/pjm/compliance/validation"
+                "data_quality_status": "/api/pjm/compliance/validation",
+                "compliance_report": "/api/pjm/compliance/report"
             }
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error validating compliance: {e}")
 
+@router.get("/compliance/report")
+async def get_compliance_report(
+    date: str = Query(..., description="Date in YYYY-MM-DD format"),
+    pnode: str = Query(default="PJM_RTO", description="Pnode ID for P&L and settlement"),
+    use_verified: bool = Query(default=False, description="Use verified settlement data"),
+    session: Session = Depends(get_session)
+):
+    """
+    Run every PJM compliance check in one request, sharing a single DB session
+    """
+    return {
+        "validation": await validate_pjm_compliance(session),
+        "pnl": await get_pjm_compliant_pnl(pnode, date, use_verified, session),
+        "settlement": await get_settlement_summary(pnode, date, session),
+        "status": await get_pjm_system_status(session)
+    }
+
 # ==================== ENHANCED FEATURES ROUTES ====================
 # Price decomposition, constraints, market status
 
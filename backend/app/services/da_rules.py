@@ -2,8 +2,9 @@
 # Server-side validation for DA order submission rules
 
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
-from sqlmodel import Session, select
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
+from sqlmodel import Session, func, select
 from ..models import TradingOrder, MarketType, OrderStatus
 from .trading_clock import trading_clock, TradingState
 import logging
@@ -11,6 +12,16 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Environment settings DAOrderRulesEngine reads, with their defaults
+_RULES_ENV_DEFAULTS = (
+    ("PJM_STATE_MACHINE_ENABLED", "true"),
+    ("MAX_ORDERS_PER_HOUR", "10"),
+)
+
+def _read_rules_env() -> Tuple[str, ...]:
+    """Current raw values of every _RULES_ENV_DEFAULTS setting, in order"""
+    return tuple(os.getenv(name, default) for name, default in _RULES_ENV_DEFAULTS)
+
 class DAOrderValidationError(Exception):
     """Raised when DA order validation fails"""
     def __init__(self, message: str, error_code: str = "VALIDATION_ERROR"):
@@ -29,9 +40,16 @@ class DAOrderRulesEngine:
     4. Proper timezone handling for edge cases
     """
     
-    def __init__(self):
-        self.max_da_orders_per_hour = int(os.getenv("MAX_ORDERS_PER_HOUR", "10"))
-        self.feature_enabled = os.getenv("PJM_STATE_MACHINE_ENABLED", "true").lower() == "true"
+    def __init__(self, env: Optional[Tuple[str, ...]] = None):
+        feature_flag, max_orders_per_hour = env if env is not None else _read_rules_env()
+        
+        self.max_da_orders_per_hour = int(max_orders_per_hour)
+        self.feature_enabled = feature_flag.lower() == "true"
+    
+    @staticmethod
+    def reset_for_tests() -> None:
+        """Forget memoized engines so the next get_da_rules_engine() re-reads the environment"""
+        _da_rules_engine_for.cache_clear()
     
     def validate_da_order_submission(
         self,
@@ -60,29 +78,22 @@ class DAOrderRulesEngine:
         if now_utc is None:
             now_utc = datetime.utcnow()
         
-        # Get trading state
-        trading_info = trading_clock.get_trading_info(now_utc)
-        state = TradingState(trading_info["state"])
+        # Check 1: Feature flag (if disabled, use legacy behavior before any clock work)
+        if not self.feature_enabled:
+            return self._legacy_validation(session, user_id, node, hour_start_utc, now_utc)
+        
+        # Get trading state and permissions from one clock lookup
+        state, da_allowed, rt_allowed = trading_clock.evaluate(now_utc)
         
         validation_result = {
             "valid": True,
             "trading_state": state.value,
-            "permissions": trading_info["permissions"],
+            "permissions": {"da_orders": da_allowed, "rt_orders": rt_allowed},
             "checks": [],
             "warnings": []
         }
         
-        # Check 1: Feature flag (if disabled, use legacy behavior)
-        if not self.feature_enabled:
-            validation_result["checks"].append({
-                "check": "feature_flag",
-                "status": "pass",
-                "message": "PJM state machine disabled, using legacy validation"
-            })
-            return self._legacy_validation(session, user_id, node, hour_start_utc, now_utc)
-        
         # Check 2: Trading state allows DA orders
-        da_allowed = trading_info["permissions"]["da_orders"]
         if not da_allowed:
             cutoff_message = trading_clock.get_da_cutoff_message(now_utc)
             validation_result["checks"].append({
@@ -114,7 +125,8 @@ class DAOrderRulesEngine:
                 "EDGE_CASE_TIMING"
             )
         
-        # Check 4: Hour limit validation
+        # Check 4: Hour limit validation - the only DB query, so it stays after
+        # every time-based rejection above
         hour_limit_result = self._validate_hour_limits(
             session, user_id, node, hour_start_utc
         )
@@ -192,17 +204,15 @@ class DAOrderRulesEngine:
         """Validate DA order limits per hour per user"""
         try:
             # Count existing DA orders for this hour
-            existing_orders = session.exec(
-                select(TradingOrder).where(
+            order_count = session.exec(
+                select(func.count()).select_from(TradingOrder).where(
                     TradingOrder.user_id == user_id,
                     TradingOrder.node == node,
                     TradingOrder.market == MarketType.DAY_AHEAD,
                     TradingOrder.hour_start_utc == hour_start_utc,
                     TradingOrder.status.in_([OrderStatus.PENDING, OrderStatus.FILLED])
                 )
-            ).all()
-            
-            order_count = len(existing_orders)
+            ).one()
             
             if order_count >= self.max_da_orders_per_hour:
                 return {
@@ -309,8 +319,17 @@ class DAOrderRulesEngine:
             "warnings": []
         }
 
+@lru_cache(maxsize=None)
+def _da_rules_engine_for(env: Tuple[str, ...]) -> DAOrderRulesEngine:
+    """One rules engine per distinct set of _RULES_ENV_DEFAULTS values"""
+    return DAOrderRulesEngine(env)
+
+def get_da_rules_engine() -> DAOrderRulesEngine:
+    """Shared DAOrderRulesEngine for the current PJM_STATE_MACHINE_ENABLED / MAX_ORDERS_PER_HOUR"""
+    return _da_rules_engine_for(_read_rules_env())
+
 # Global instance for use across the application  
-da_rules_engine = DAOrderRulesEngine()
+da_rules_engine = get_da_rules_engine()
 
 # Convenience functions
 def validate_da_order(
@@ -13,6 +13,13 @@ from ..models import (
 import logging
 import os
 import json
+import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels run as plain NumPy
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 logger = logging.getLogger(__name__)
 
@@ -387,12 +394,72 @@ class EnhancedSettlementEngine:
             logger.error(f"Error persisting end-of-day ledger: {e}")
             return [{"error": str(e)}]
 
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _bucket_pnl_kernel(da_price, q_over_12, rt_prices):
+    """12 bucket P&Ls for one hour; callers validate the interval count"""
+    return (da_price - rt_prices) * q_over_12
+
+def _bucket_pnl_matrix(da_prices, quantity_mwh, rt_prices_2d) -> np.ndarray:
+    """(H, 12) bucket P&Ls for H delivery hours, validating the interval count once"""
+    rt_prices = np.asarray(rt_prices_2d, dtype=np.float64)
+    if rt_prices.ndim != 2 or rt_prices.shape[1] != 12:
+        raise ValueError("RT prices must contain exactly 12 five-minute intervals")
+    
+    da_prices = np.asarray(da_prices, dtype=np.float64).reshape(-1, 1)
+    bucket_quantity = np.asarray(quantity_mwh, dtype=np.float64).reshape(-1, 1) / 12.0
+    
+    # PJM Formula: (P_DA - P_RT,t) × q/12, evaluated for every bucket of every hour at once
+    # Works for both BUY and SELL orders correctly
+    return (da_prices - rt_prices) * bucket_quantity
+
+def calculate_day_pnl_da_vs_rt(
+    da_prices,
+    quantity_mwh,
+    rt_prices_2d
+) -> np.ndarray:
+    """
+    Batched PJM bucket-by-bucket P&L for many delivery hours
+    
+    Args:
+        da_prices: (H,) day-ahead fill prices ($/MWh)
+        quantity_mwh: Order quantity (MWh), scalar or (H,) per hour
+        rt_prices_2d: (H, 12) real-time 5-minute prices ($/MWh)
+    
+    Returns:
+        (H,) array of unrounded hour P&L totals
+    """
+    return _bucket_pnl_matrix(da_prices, quantity_mwh, rt_prices_2d).sum(axis=1)
+
+def calculate_hour_pnl_da_vs_rt_fast(
+    da_price: float,
+    quantity_mwh: float,
+    rt_prices_5min
+) -> Tuple[float, np.ndarray]:
+    """
+    Array-only PJM bucket-by-bucket P&L for settlement loops
+    
+    Args:
+        da_price: Day-ahead fill price ($/MWh)
+        quantity_mwh: Order quantity (MWh)
+        rt_prices_5min: 12 real-time 5-minute prices ($/MWh), list or array
+    
+    Returns:
+        (unrounded hour P&L total, array of the 12 bucket P&Ls)
+    """
+    rt_prices = np.asarray(rt_prices_5min, dtype=np.float64)
+    if rt_prices.shape != (12,):
+        raise ValueError("RT prices must contain exactly 12 five-minute intervals")
+    
+    bucket_pnls = _bucket_pnl_kernel(float(da_price), quantity_mwh / 12.0, rt_prices)
+    return float(bucket_pnls.sum()), bucket_pnls
+
 # Convenience function for bucket-by-bucket P&L calculation (reference implementation)
 def calculate_hour_pnl_da_vs_rt(
     da_price: float,
     quantity_mwh: float,
     rt_prices_5min: List[float],
-    side: str = "BUY"
+    side: str = "BUY",
+    include_details: bool = False
 ) -> Dict:
     """
     Reference implementation of PJM bucket-by-bucket P&L calculation
@@ -402,40 +469,41 @@ def calculate_hour_pnl_da_vs_rt(
         quantity_mwh: Order quantity (MWh)
         rt_prices_5min: List of 12 real-time 5-minute prices ($/MWh)
         side: Order side ("BUY" or "SELL")
+        include_details: Also return the per-bucket breakdown as bucket_details
     
     Returns:
-        Dictionary with bucket-by-bucket P&L breakdown
+        Dictionary with the hour P&L and, on request, its bucket-by-bucket breakdown
     """
     if len(rt_prices_5min) != 12:
         raise ValueError("RT prices must contain exactly 12 five-minute intervals")
     
-    bucket_quantity = quantity_mwh / 12.0  # q/12 MWh per bucket
-    hour_pnl_total = 0.0
-    bucket_details = []
-    
-    for i, rt_price in enumerate(rt_prices_5min):
-        # PJM Formula: (P_DA - P_RT,t) × q/12
-        # Works for both BUY and SELL orders correctly
-        bucket_pnl = (da_price - rt_price) * bucket_quantity
-        hour_pnl_total += bucket_pnl
-        
-        bucket_details.append({
-            "interval": i + 1,
-            "rt_price": rt_price,
-            "bucket_quantity_mwh": bucket_quantity,
-            "bucket_pnl": round(bucket_pnl, 4),
-            "formula": f"({da_price} - {rt_price}) × {bucket_quantity:.4f}"
-        })
+    hour_pnl_total, bucket_pnls = calculate_hour_pnl_da_vs_rt_fast(
+        da_price, quantity_mwh, rt_prices_5min
+    )
     
-    return {
+    result = {
         "da_price": da_price,
         "quantity_mwh": quantity_mwh,
         "side": side,
         "hour_pnl_total": round(hour_pnl_total, 2),
-        "bucket_details": bucket_details,
         "formula_used": "P&L_H = Σ(P_DA - P_RT,t) × q/12",
         "intervals_calculated": 12
     }
+    
+    if include_details:
+        bucket_quantity = quantity_mwh / 12.0  # q/12 MWh per bucket
+        result["bucket_details"] = [
+            {
+                "interval": i + 1,
+                "rt_price": rt_price,
+                "bucket_quantity_mwh": bucket_quantity,
+                "bucket_pnl": round(bucket_pnl, 4),
+                "formula": f"({da_price} - {rt_price}) × {bucket_quantity:.4f}"
+            }
+            for i, (rt_price, bucket_pnl) in enumerate(zip(rt_prices_5min, bucket_pnls.tolist()))
+        ]
+    
+    return result
 
 # Global instance
 settlement_engine = None
@@ -1,15 +1,59 @@
 # PJM Trading Clock Service - DST-Safe Trading Day State Management
 # Implements PJM-accurate trading-day logic with proper Eastern Time handling
 
-from datetime import datetime, time
+from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from numbers import Real
+from typing import Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
+import calendar
 import logging
 import os
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; every clock shares the same tz database entry
+_ET = ZoneInfo("America/New_York")
+_UTC = timezone.utc
+
+# Eastern Time has followed the Energy Policy Act rule since 2007: EDT from 02:00 on the
+# second Sunday of March to 02:00 on the first Sunday of November, EST otherwise
+_US_DST_RULE_SINCE = 2007
+_EST_OFFSET = timedelta(hours=-5)
+_EDT_OFFSET = timedelta(hours=-4)
+# Eastern Time transitions happen at 02:00 local; on spring-forward day 02:00-02:59 is skipped
+_DST_GAP_START = time(2, 0, 0)
+_DST_GAP_END = time(3, 0, 0)
+
+# Naive UTC epoch, for mapping POSIX timestamps onto trading-day boundaries
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_SECONDS_PER_DAY = 86400
+_MICROSECOND = timedelta(microseconds=1)
+
+# Environment settings a TradingClock is built from, with their defaults; the raw
+# values double as the memo key in get_trading_clock
+_CLOCK_ENV_DEFAULTS = (
+    ("PJM_STATE_MACHINE_ENABLED", "true"),
+    ("ORDER_CUTOFF_HOUR", "11"),
+    ("ORDER_CUTOFF_MINUTE", "0"),
+    ("ORDER_CUTOFF_SECOND", "0"),
+    ("MARKET_OPEN_HOUR", "0"),
+    ("MARKET_CLOSE_HOUR", "23"),
+    ("MARKET_CLOSE_MINUTE", "59"),
+)
+
+def _read_clock_env() -> Tuple[str, ...]:
+    """Current raw values of every _CLOCK_ENV_DEFAULTS setting, in order"""
+    return tuple(os.getenv(name, default) for name, default in _CLOCK_ENV_DEFAULTS)
+
+def _nth_sunday(year: int, month: int, n: int) -> date:
+    """Date of the n-th Sunday of a month"""
+    days_to_sunday = (calendar.SUNDAY - calendar.weekday(year, month, 1)) % 7
+    return date(year, month, 1 + days_to_sunday + 7 * (n - 1))
+
 class TradingState(Enum):
     """PJM Trading Day States"""
     PRE_MARKET = "PRE_MARKET"      # Midnight to market open
@@ -17,6 +61,23 @@ class TradingState(Enum):
     POST_11AM = "POST_11AM"        # DA closed, RT only
     END_OF_DAY = "END_OF_DAY"      # Market closing, settle positions
 
+# (DA allowed, RT allowed) per state while the state machine is enabled
+_STATE_PERMISSIONS = {
+    TradingState.PRE_MARKET: (False, False),
+    TradingState.PRE_11AM: (True, True),
+    TradingState.POST_11AM: (False, True),
+    TradingState.END_OF_DAY: (False, False),
+}
+
+# Code -> state for the uint8 arrays returned by TradingClock.get_trading_states
+TRADING_STATE_CODES = (
+    TradingState.PRE_MARKET,
+    TradingState.PRE_11AM,
+    TradingState.POST_11AM,
+    TradingState.END_OF_DAY,
+)
+_STATE_CODE = {state: code for code, state in enumerate(TRADING_STATE_CODES)}
+
 class TradingClock:
     """
     PJM-compliant trading clock with DST-safe timezone handling
@@ -28,30 +89,49 @@ class TradingClock:
     - 23:59:59 ET → END_OF_DAY (close RT, persist ledgers)
     """
     
-    def __init__(self):
-        self.timezone = ZoneInfo("America/New_York")
-        self.feature_enabled = self._get_feature_flag()
+    def __init__(self, env: Optional[Tuple[str, ...]] = None):
+        (
+            feature_flag,
+            cutoff_hour, cutoff_minute, cutoff_second,
+            open_hour, close_hour, close_minute
+        ) = env if env is not None else _read_clock_env()
+        
+        self.timezone = _ET
+        self.feature_enabled = feature_flag.lower() == "true"
         
         # Configurable cutoff times
-        self.da_cutoff_hour = int(os.getenv("ORDER_CUTOFF_HOUR", "11"))
-        self.da_cutoff_minute = int(os.getenv("ORDER_CUTOFF_MINUTE", "0"))
-        self.da_cutoff_second = int(os.getenv("ORDER_CUTOFF_SECOND", "0"))
+        self.da_cutoff_hour = int(cutoff_hour)
+        self.da_cutoff_minute = int(cutoff_minute)
+        self.da_cutoff_second = int(cutoff_second)
         
         # Market session times
-        self.market_open_hour = int(os.getenv("MARKET_OPEN_HOUR", "0"))  # Midnight
-        self.market_close_hour = int(os.getenv("MARKET_CLOSE_HOUR", "23"))
-        self.market_close_minute = int(os.getenv("MARKET_CLOSE_MINUTE", "59"))
+        self.market_open_hour = int(open_hour)  # Midnight
+        self.market_close_hour = int(close_hour)
+        self.market_close_minute = int(close_minute)
         
-    def _get_feature_flag(self) -> bool:
-        """Get PJM state machine feature flag"""
-        return os.getenv("PJM_STATE_MACHINE_ENABLED", "true").lower() == "true"
-    
-    def get_trading_state(self, now_utc: Optional[datetime] = None) -> TradingState:
+        # Year -> (ordinal of Jan 1, naive UTC boundaries of each ET trading day in order)
+        self._year_tables: Dict[int, Tuple[int, List[Tuple[datetime, datetime, datetime, datetime]]]] = {}
+        # Year -> ET dates whose UTC offset changes during the day
+        self._dst_dates: Dict[int, frozenset] = {}
+        # Year -> (spring-forward date, fall-back date) under the US rule
+        self._dst_bounds: Dict[int, Tuple[date, date]] = {}
+        # Year -> the same boundaries as POSIX timestamps, for numeric lookups
+        self._year_ts_tables: Dict[int, Tuple[int, List[Tuple[float, float, float, float]]]] = {}
+        # Year -> (days, 4) int64 array of the boundaries in epoch nanoseconds, for batches
+        self._year_ns_tables: Dict[int, np.ndarray] = {}
+        # State -> get_trading_info fields that never change for that state
+        self._info_templates: Dict[TradingState, Dict] = {}
+        # (trading-day ordinal, boundary index) -> (next state, ET isoformat, POSIX timestamp)
+        self._transition_templates: Dict[Tuple[int, int], Tuple[str, str, float]] = {}
+        
+    def get_trading_state(self, now_utc: Optional[Union[datetime, Real]] = None) -> TradingState:
         """
         Get current trading state (DST-safe)
         
         Args:
-            now_utc: Optional current time in UTC (for testing)
+            now_utc: Optional current time in UTC (for testing), as a datetime
+                or a POSIX timestamp in seconds (any real number, e.g. int,
+                float or np.int64; bools are not accepted)
             
         Returns:
             TradingState enum value
@@ -60,49 +140,274 @@ class TradingClock:
             # Legacy behavior - always allow trading
             return TradingState.PRE_11AM
         
+        if isinstance(now_utc, Real) and not isinstance(now_utc, bool):
+            return self._state_for_timestamp(float(now_utc))
+        
         if now_utc is None:
             now_utc = datetime.utcnow()
+        now_utc = now_utc.replace(tzinfo=None)
         
-        # Convert to Eastern Time (handles DST automatically)
-        now_et = now_utc.replace(tzinfo=ZoneInfo("UTC")).astimezone(self.timezone)
-        current_time = now_et.time()
-        
-        # Define cutoff times
-        da_cutoff = time(self.da_cutoff_hour, self.da_cutoff_minute, self.da_cutoff_second)
-        market_close = time(self.market_close_hour, self.market_close_minute, 59)
-        market_open = time(self.market_open_hour, 0, 0)
+        # An instant on UTC date D falls in ET trading day D or D-1
+        day_start, market_open, da_cutoff, market_closed = self._cutoff_utc_for(now_utc.date())
+        if now_utc < day_start:
+            day_start, market_open, da_cutoff, market_closed = self._cutoff_utc_for(
+                now_utc.date() - timedelta(days=1)
+            )
         
         # State machine logic
-        if current_time >= market_open and current_time < da_cutoff:
+        if market_open <= now_utc < da_cutoff:
+            return TradingState.PRE_11AM
+        elif da_cutoff <= now_utc < market_closed:
+            return TradingState.POST_11AM
+        else:
+            return TradingState.END_OF_DAY
+    
+    def _state_for_timestamp(self, now_ts: float) -> TradingState:
+        """get_trading_state for a POSIX timestamp, compared without building datetimes"""
+        _, (day_start, market_open, da_cutoff, market_closed) = self._trading_day_for_timestamp(now_ts)
+        
+        if market_open <= now_ts < da_cutoff:
             return TradingState.PRE_11AM
-        elif current_time >= da_cutoff and current_time <= market_close:
+        elif da_cutoff <= now_ts < market_closed:
             return TradingState.POST_11AM
         else:
             return TradingState.END_OF_DAY
     
+    def _trading_day_for_timestamp(self, now_ts: float) -> Tuple[int, Tuple[float, float, float, float]]:
+        """Ordinal and timestamp boundaries of the ET trading day containing an instant"""
+        # An instant on UTC date D falls in ET trading day D or D-1
+        ordinal = int(now_ts // _SECONDS_PER_DAY) + _EPOCH_ORDINAL
+        boundaries = self._cutoff_ts_for(ordinal)
+        if now_ts < boundaries[0]:
+            ordinal -= 1
+            boundaries = self._cutoff_ts_for(ordinal)
+        return ordinal, boundaries
+    
+    def _cutoff_ts_for(self, ordinal: int) -> Tuple[float, float, float, float]:
+        """_cutoff_utc_for as POSIX timestamps, keyed by the trading date's ordinal"""
+        year = date.fromordinal(ordinal).year
+        year_table = self._year_ts_tables.get(year)
+        if year_table is None:
+            first_ordinal, table = self._year_tables.get(year) or self._table_for(year)
+            year_table = (first_ordinal, [
+                tuple((boundary - _EPOCH).total_seconds() for boundary in boundaries)
+                for boundaries in table
+            ])
+            self._year_ts_tables[year] = year_table
+        first_ordinal, table = year_table
+        return table[ordinal - first_ordinal]
+    
+    def get_trading_states(self, ts_ns) -> np.ndarray:
+        """
+        Batched get_trading_state for many instants at once
+        
+        Args:
+            ts_ns: UTC instants as datetime64 values or int64 nanoseconds since the epoch
+            
+        Returns:
+            uint8 array of the same shape holding indices into TRADING_STATE_CODES
+        """
+        ts_ns = np.asarray(ts_ns)
+        if np.issubdtype(ts_ns.dtype, np.datetime64):
+            ts_ns = ts_ns.astype("datetime64[ns]").astype(np.int64)
+        else:
+            ts_ns = ts_ns.astype(np.int64)
+        
+        if not self.feature_enabled or ts_ns.size == 0:
+            # Legacy behavior - always allow trading
+            return np.full(ts_ns.shape, _STATE_CODE[TradingState.PRE_11AM], dtype=np.uint8)
+        
+        # Early-January UTC instants can still belong to the previous year's last ET day
+        first_year = (_EPOCH + timedelta(microseconds=int(ts_ns.min()) // 1000)).year - 1
+        last_year = (_EPOCH + timedelta(microseconds=int(ts_ns.max()) // 1000)).year
+        boundaries = np.concatenate([
+            self._ns_table_for(year) for year in range(first_year, last_year + 1)
+        ])
+        
+        # Day starts are sorted, so each instant's trading day is the last start at or before it
+        day = np.searchsorted(boundaries[:, 0], ts_ns, side="right") - 1
+        market_open = boundaries[day, 1]
+        da_cutoff = boundaries[day, 2]
+        market_closed = boundaries[day, 3]
+        
+        states = np.full(ts_ns.shape, _STATE_CODE[TradingState.END_OF_DAY], dtype=np.uint8)
+        states[(market_open <= ts_ns) & (ts_ns < da_cutoff)] = _STATE_CODE[TradingState.PRE_11AM]
+        states[(da_cutoff <= ts_ns) & (ts_ns < market_closed)] = _STATE_CODE[TradingState.POST_11AM]
+        return states
+    
+    def _ns_table_for(self, year: int) -> np.ndarray:
+        """A year's trading-day boundaries as exact int64 epoch nanoseconds"""
+        ns_table = self._year_ns_tables.get(year)
+        if ns_table is None:
+            _, table = self._year_tables.get(year) or self._table_for(year)
+            ns_table = np.array([
+                [(boundary - _EPOCH) // _MICROSECOND * 1000 for boundary in boundaries]
+                for boundaries in table
+            ], dtype=np.int64)
+            self._year_ns_tables[year] = ns_table
+        return ns_table
+    
+    def _cutoff_utc_for(self, trading_date: date) -> Tuple[datetime, datetime, datetime, datetime]:
+        """
+        UTC instants of an ET trading day's midnight, market open, DA cutoff and
+        market close (DST-safe), looked up in that year's precomputed table
+        """
+        year_table = self._year_tables.get(trading_date.year)
+        if year_table is None:
+            year_table = self._table_for(trading_date.year)
+        first_ordinal, table = year_table
+        return table[trading_date.toordinal() - first_ordinal]
+    
+    def _table_for(self, year: int) -> Tuple[int, List[Tuple[datetime, datetime, datetime, datetime]]]:
+        """Resolve every trading day of the year at once and keep the table"""
+        # The close is inclusive through HH:MM:59, so the day ends one microsecond later
+        local_times = (
+            time(0, 0, 0),
+            time(self.market_open_hour, 0, 0),
+            time(self.da_cutoff_hour, self.da_cutoff_minute, self.da_cutoff_second),
+            time(self.market_close_hour, self.market_close_minute, 59),
+        )
+        end_of_close = timedelta(microseconds=1)
+        
+        # Years under the fixed US rule need no tz database lookups at all
+        dst_bounds = self._dst_bounds_for(year) if year >= _US_DST_RULE_SINCE else None
+        
+        first_ordinal = date(year, 1, 1).toordinal()
+        table = []
+        for ordinal in range(first_ordinal, date(year + 1, 1, 1).toordinal()):
+            trading_date = date.fromordinal(ordinal)
+            if dst_bounds is not None:
+                boundaries = [
+                    self._rule_utc(trading_date, local_time, *dst_bounds)
+                    for local_time in local_times
+                ]
+            elif self._needs_dst_care(trading_date):
+                boundaries = [self._zoneinfo_utc(trading_date, local_time) for local_time in local_times]
+            else:
+                # One UTC offset holds all day, so a single lookup covers every boundary
+                offset = self.timezone.utcoffset(datetime.combine(trading_date, time(12, 0, 0)))
+                boundaries = [datetime.combine(trading_date, local_time) - offset for local_time in local_times]
+            boundaries[3] += end_of_close
+            table.append(tuple(boundaries))
+        
+        self._year_tables[year] = (first_ordinal, table)
+        return self._year_tables[year]
+    
+    def _dst_bounds_for(self, year: int) -> Tuple[date, date]:
+        """Spring-forward and fall-back dates of a year, by calendar arithmetic"""
+        bounds = self._dst_bounds.get(year)
+        if bounds is None:
+            bounds = (_nth_sunday(year, 3, 2), _nth_sunday(year, 11, 1))
+            self._dst_bounds[year] = bounds
+        return bounds
+    
+    @staticmethod
+    def _rule_offset(trading_date: date, local_time: time, spring_forward: date, fall_back: date) -> timedelta:
+        """
+        UTC offset of an ET wall time under the US rule, resolving the skipped and
+        repeated hours the way zoneinfo does for fold=0 (pre-transition offset)
+        """
+        if spring_forward < trading_date < fall_back:
+            return _EDT_OFFSET
+        if trading_date == spring_forward:
+            # 02:00-02:59 does not exist; it maps through EST like zoneinfo's fold=0
+            return _EDT_OFFSET if local_time >= _DST_GAP_END else _EST_OFFSET
+        if trading_date == fall_back:
+            # 01:00-01:59 repeats; fold=0 picks the first (EDT) occurrence
+            return _EST_OFFSET if local_time >= _DST_GAP_START else _EDT_OFFSET
+        return _EST_OFFSET
+    
+    @classmethod
+    def _rule_utc(cls, trading_date: date, local_time: time, spring_forward: date, fall_back: date) -> datetime:
+        """
+        Naive UTC instant of an ET wall-clock boundary under the US rule
+
+        A boundary inside the skipped spring-forward hour has passed as soon as
+        clocks jump, so it resolves to the 03:00 EDT transition itself.
+        """
+        if trading_date == spring_forward and _DST_GAP_START <= local_time < _DST_GAP_END:
+            local_time = _DST_GAP_END
+        return datetime.combine(trading_date, local_time) - cls._rule_offset(
+            trading_date, local_time, spring_forward, fall_back
+        )
+    
+    def _zoneinfo_utc(self, trading_date: date, local_time: time) -> datetime:
+        """_rule_utc through the tz database, for years before the current US rule"""
+        local = datetime.combine(trading_date, local_time)
+        utc = local.replace(tzinfo=self.timezone).astimezone(_UTC)
+        if utc.astimezone(self.timezone).replace(tzinfo=None) != local:
+            # The wall time was skipped by a spring-forward transition
+            utc = datetime.combine(trading_date, _DST_GAP_END, tzinfo=self.timezone).astimezone(_UTC)
+        return utc.replace(tzinfo=None)
+    
+    def _needs_dst_care(self, trading_date: date) -> bool:
+        """True on the ET dates where a DST transition shifts the UTC offset mid-day"""
+        dst_dates = self._dst_dates.get(trading_date.year)
+        if dst_dates is None:
+            # Compare consecutive local midnights once per year instead of hard-coding the
+            # second Sunday of March / first Sunday of November, so rule changes still hold
+            first_day = date(trading_date.year, 1, 1)
+            days = [first_day + timedelta(days=i) for i in range(367)]
+            offsets = [self.timezone.utcoffset(datetime.combine(day, time(0, 0, 0))) for day in days]
+            dst_dates = frozenset(
+                day for day, offset, next_offset in zip(days, offsets, offsets[1:])
+                if offset != next_offset and day.year == trading_date.year
+            )
+            self._dst_dates[trading_date.year] = dst_dates
+        return trading_date in dst_dates
+    
+    @staticmethod
+    def reset_for_tests() -> None:
+        """Forget memoized clocks so the next get_trading_clock() re-reads the environment"""
+        _trading_clock_for.cache_clear()
+    
+    def clear_cache(self) -> None:
+        """Drop cached day boundaries, e.g. after changing cutoff configuration"""
+        self._year_tables.clear()
+        self._dst_dates.clear()
+        self._dst_bounds.clear()
+        self._year_ts_tables.clear()
+        self._year_ns_tables.clear()
+        self._info_templates.clear()
+        self._transition_templates.clear()
+    
     def get_trading_info(self, now_utc: Optional[datetime] = None) -> Dict:
         """
         Get comprehensive trading state information
         
         Returns:
-            Dictionary with trading state, permissions, and timing info
+            Dictionary with trading state, permissions, and timing info, owned
+            by the caller
         """
         if now_utc is None:
             now_utc = datetime.utcnow()
             
-        now_et = now_utc.replace(tzinfo=ZoneInfo("UTC")).astimezone(self.timezone)
+        now_et = now_utc.replace(tzinfo=_UTC).astimezone(self.timezone)
         state = self.get_trading_state(now_utc)
         
-        # Calculate time to next state transition
-        next_transition = self._get_next_transition_time(now_et)
+        template = self._info_templates.get(state)
+        if template is None:
+            template = self._info_template_for(state)
         
-        return {
+        # Only the timestamps and the countdown differ between calls in the same state;
+        # the nested dicts are copied too so callers never mutate the template
+        info = template.copy()
+        info["permissions"] = template["permissions"].copy()
+        info["cutoff_config"] = template["cutoff_config"].copy()
+        info["timestamp_utc"] = now_utc.isoformat()
+        info["timestamp_et"] = now_et.isoformat()
+        info["next_transition"] = self._get_next_transition_time(now_et)
+        return info
+    
+    def _info_template_for(self, state: TradingState) -> Dict:
+        """Build and keep the per-state part of get_trading_info, in response key order"""
+        template = {
             "state": state.value,
-            "timestamp_utc": now_utc.isoformat(),
-            "timestamp_et": now_et.isoformat(), 
+            "timestamp_utc": None,
+            "timestamp_et": None,
             "timezone": str(self.timezone),
             "permissions": self._get_permissions(state),
-            "next_transition": next_transition,
+            "next_transition": None,
             "feature_enabled": self.feature_enabled,
             "cutoff_config": {
                 "da_cutoff_hour": self.da_cutoff_hour,
@@ -111,58 +416,78 @@ class TradingClock:
                 "market_close_minute": self.market_close_minute
             }
         }
+        self._info_templates[state] = template
+        return template
     
     def _get_permissions(self, state: TradingState) -> Dict[str, bool]:
         """Get trading permissions for current state"""
         if not self.feature_enabled:
             return {"da_orders": True, "rt_orders": True}
-            
-        permissions = {
-            TradingState.PRE_MARKET: {"da_orders": False, "rt_orders": False},
-            TradingState.PRE_11AM: {"da_orders": True, "rt_orders": True},
-            TradingState.POST_11AM: {"da_orders": False, "rt_orders": True},
-            TradingState.END_OF_DAY: {"da_orders": False, "rt_orders": False}
-        }
         
-        return permissions.get(state, {"da_orders": False, "rt_orders": False})
+        da_allowed, rt_allowed = _STATE_PERMISSIONS.get(state, (False, False))
+        return {"da_orders": da_allowed, "rt_orders": rt_allowed}
+    
+    def evaluate(self, now_utc: Optional[Union[datetime, Real]] = None) -> Tuple[TradingState, bool, bool]:
+        """
+        Trading state and permissions from a single cutoff-table lookup
+        
+        Returns:
+            (state, DA orders allowed, RT orders allowed)
+        """
+        state = self.get_trading_state(now_utc)
+        if not self.feature_enabled:
+            return state, True, True
+        
+        da_allowed, rt_allowed = _STATE_PERMISSIONS.get(state, (False, False))
+        return state, da_allowed, rt_allowed
     
     def _get_next_transition_time(self, now_et: datetime) -> Dict:
         """Calculate time until next state transition"""
-        current_time = now_et.time()
-        current_date = now_et.date()
-        
-        # Define transition times
-        da_cutoff = time(self.da_cutoff_hour, self.da_cutoff_minute, self.da_cutoff_second)
-        market_close = time(self.market_close_hour, self.market_close_minute, 59)
-        market_open = time(0, 0, 0)
-        
-        # Find next transition
-        next_transition_time = None
-        next_state = None
-        
-        if current_time < da_cutoff:
-            next_transition_time = datetime.combine(current_date, da_cutoff).replace(tzinfo=self.timezone)
-            next_state = TradingState.POST_11AM
-        elif current_time < market_close:
-            next_transition_time = datetime.combine(current_date, market_close).replace(tzinfo=self.timezone)
-            next_state = TradingState.END_OF_DAY
+        now_ts = now_et.timestamp()
+        
+        # Pick the next boundary from the same UTC table get_trading_state compares
+        # against, so the countdown always agrees with the state on DST days
+        ordinal, (_, market_open, da_cutoff, market_closed) = self._trading_day_for_timestamp(now_ts)
+        if now_ts < market_open:
+            boundary_index = 1
+        elif now_ts < da_cutoff:
+            boundary_index = 2
+        elif now_ts < market_closed:
+            boundary_index = 3
         else:
             # Next day market open
-            from datetime import timedelta
-            next_date = current_date + timedelta(days=1)
-            next_transition_time = datetime.combine(next_date, market_open).replace(tzinfo=self.timezone)
-            next_state = TradingState.PRE_11AM
+            ordinal, boundary_index = ordinal + 1, 1
+        
+        transition = self._transition_templates.get((ordinal, boundary_index))
+        if transition is None:
+            transition = self._transition_for(ordinal, boundary_index)
+        next_state, next_transition_et, next_transition_ts = transition
         
-        # Calculate seconds until transition
-        seconds_until = (next_transition_time - now_et).total_seconds()
+        # Calculate seconds until transition straight from the timestamp table
+        seconds_until = next_transition_ts - now_ts
         
         return {
-            "next_state": next_state.value if next_state else None,
-            "next_transition_et": next_transition_time.isoformat(),
+            "next_state": next_state,
+            "next_transition_et": next_transition_et,
             "seconds_until": int(seconds_until),
             "human_readable": self._format_duration(seconds_until)
         }
     
+    def _transition_for(self, ordinal: int, boundary_index: int) -> Tuple[str, str, float]:
+        """Resolve and keep one boundary (open, DA cutoff or close) of an ET trading day"""
+        next_state = (None, TradingState.PRE_11AM, TradingState.POST_11AM, TradingState.END_OF_DAY)[boundary_index]
+        boundary_utc = self._cutoff_utc_for(date.fromordinal(ordinal))[boundary_index]
+        next_transition_ts = self._cutoff_ts_for(ordinal)[boundary_index]
+        
+        # The table's close boundary sits one microsecond after HH:MM:59; show HH:MM:59
+        if boundary_index == 3:
+            boundary_utc -= _MICROSECOND
+        next_transition_et = boundary_utc.replace(tzinfo=_UTC).astimezone(self.timezone).isoformat()
+        
+        transition = (next_state.value, next_transition_et, next_transition_ts)
+        self._transition_templates[(ordinal, boundary_index)] = transition
+        return transition
+    
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format"""
         if seconds < 0:
@@ -179,36 +504,44 @@ class TradingClock:
         else:
             return f"{secs}s"
     
-    def is_da_allowed(self, now_utc: Optional[datetime] = None) -> bool:
+    def is_da_allowed(self, now_utc: Optional[Union[datetime, Real]] = None) -> bool:
         """Check if DA orders are currently allowed"""
-        state = self.get_trading_state(now_utc)
-        permissions = self._get_permissions(state)
-        return permissions["da_orders"]
+        return self.evaluate(now_utc)[1]
     
-    def is_rt_allowed(self, now_utc: Optional[datetime] = None) -> bool:
+    def is_rt_allowed(self, now_utc: Optional[Union[datetime, Real]] = None) -> bool:
         """Check if RT orders are currently allowed"""
-        state = self.get_trading_state(now_utc)
-        permissions = self._get_permissions(state)
-        return permissions["rt_orders"]
+        return self.evaluate(now_utc)[2]
     
     def get_da_cutoff_message(self, now_utc: Optional[datetime] = None) -> Optional[str]:
         """Get user-friendly message about DA cutoff status"""
         if not self.feature_enabled:
             return None
             
+        if now_utc is None:
+            now_utc = datetime.utcnow()
         state = self.get_trading_state(now_utc)
         
         if state == TradingState.PRE_11AM:
-            info = self.get_trading_info(now_utc)
-            duration = info["next_transition"]["human_readable"]
+            # Only the countdown is needed, not the rest of get_trading_info
+            now_et = now_utc.replace(tzinfo=_UTC).astimezone(self.timezone)
+            duration = self._get_next_transition_time(now_et)["human_readable"]
             return f"DA orders close in {duration}"
         elif state == TradingState.POST_11AM:
             return f"DA orders closed until tomorrow {self.da_cutoff_hour:02d}:00 ET"
         else:
             return "Market closed - DA orders unavailable"
 
+@lru_cache(maxsize=None)
+def _trading_clock_for(env: Tuple[str, ...]) -> TradingClock:
+    """One TradingClock per distinct set of _CLOCK_ENV_DEFAULTS values"""
+    return TradingClock(env)
+
+def get_trading_clock() -> TradingClock:
+    """Shared TradingClock for the current state machine, cutoff and market-hours settings"""
+    return _trading_clock_for(_read_clock_env())
+
 # Global instance for use across the application
-trading_clock = TradingClock()
+trading_clock = get_trading_clock()
 
 # Convenience functions for backward compatibility
 def get_trading_state(now_utc: Optional[datetime] = None) -> TradingState:
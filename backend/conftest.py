@@ -0,0 +1,188 @@
+"""
+Shared pytest fixtures for the Virtual Energy Trading backend
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlmodel import Session, SQLModel, create_engine
+
+# Manual script that drives a running backend; run it directly with python
+collect_ignore = ["test_api.py"]
+
+# Fixed wall-clock instant so order times and price ticks line up across tests
+_FROZEN_NOW = datetime(2024, 1, 15, 12, 0, 0)
+_FROZEN_HOUR_START = _FROZEN_NOW.replace(minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture(scope="session")
+def engine(tmp_path_factory):
+    """Throwaway SQLite file engine with the schema created once per test session
+
+    Never the application's own engine, so test runs leave DATABASE_URL untouched.
+    """
+    import app.models  # noqa: F401 - register tables on SQLModel.metadata
+
+    db_file = tmp_path_factory.mktemp("db") / "trading.db"
+    engine = create_engine(f"sqlite:///{db_file}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine, checkfirst=True)
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_session(engine):
+    """Session on the throwaway test engine, shared for the test session"""
+    with Session(engine) as session:
+        yield session
+
+
+@lru_cache(maxsize=None)
+def _ddl_script() -> str:
+    """CREATE TABLE/INDEX script for every model, compiled once per process"""
+    import app.models  # noqa: F401 - register tables on SQLModel.metadata
+
+    dialect = sqlite.dialect()
+    statements = []
+    for table in SQLModel.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        statements.extend(
+            str(CreateIndex(index).compile(dialect=dialect)).strip()
+            for index in table.indexes
+        )
+    return ";\n".join(statements) + ";"
+
+
+@pytest.fixture(scope="session")
+def memory_engine():
+    """Shared-cache in-memory database whose schema is created once per worker"""
+    engine = create_engine(
+        "sqlite+pysqlite:///file:memdb1?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # Let SQLAlchemy own transaction boundaries so SAVEPOINTs nest correctly
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    # The database is throwaway, so skip journaling and durability work on commit
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in (
+            "journal_mode=MEMORY",
+            "synchronous=OFF",
+            "temp_store=MEMORY",
+            "locking_mode=EXCLUSIVE",
+            "cache_size=-20000",
+        ):
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Apply the precompiled schema directly instead of going through create_all
+    raw_connection = engine.raw_connection()
+    try:
+        raw_connection.driver_connection.executescript(_ddl_script())
+    finally:
+        raw_connection.close()
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def test_session(memory_engine):
+    """Session whose commits land in a SAVEPOINT rolled back after each test
+
+    Instances stay loaded across commits; code under test mutates the same
+    identity-mapped objects, so tests read results without a refresh.
+    """
+    connection = memory_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    )
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def now():
+    """Frozen timestamp used for order times and price ticks"""
+    return _FROZEN_NOW
+
+
+@pytest.fixture
+def hour_start():
+    """Top of the frozen hour, shared by order time slots and ticks"""
+    return _FROZEN_HOUR_START
+
+
+@lru_cache(maxsize=None)
+def _order_templates() -> dict:
+    """Per-market TradingOrder field templates, built once per process
+
+    model_copy would share SQLAlchemy instance state between orders, so each
+    order is constructed from a dict merge instead.
+    """
+    from app.models import MarketType, OrderSide, OrderStatus, OrderType
+
+    common = {
+        "user_id": "test_user",
+        "node": "PJM_RTO",
+        "side": OrderSide.BUY,
+        "quantity_mwh": 1.0,
+        "status": OrderStatus.PENDING,
+    }
+    return {
+        MarketType.REAL_TIME: {
+            **common,
+            "market": MarketType.REAL_TIME,
+            "hour_start_utc": _FROZEN_NOW,
+            "time_slot_utc": _FROZEN_HOUR_START,
+            "order_type": OrderType.MARKET,
+        },
+        MarketType.DAY_AHEAD: {
+            **common,
+            "market": MarketType.DAY_AHEAD,
+            "hour_start_utc": _FROZEN_HOUR_START,
+            "order_type": OrderType.LIMIT,
+        },
+    }
+
+
+@pytest.fixture
+def make_order(test_session):
+    """Factory adding pending PJM_RTO BUY orders to the test session
+
+    Orders default to an RT market order (or a DA limit order) at the frozen
+    hour; commit once after building every order the test needs.
+    """
+    from app.models import MarketType, TradingOrder
+
+    templates = _order_templates()
+
+    def _make(market=MarketType.REAL_TIME, **overrides):
+        order = TradingOrder(**{**templates[market], **overrides})
+        test_session.add(order)
+        return order
+
+    return _make
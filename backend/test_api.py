@@ -11,21 +11,23 @@ from datetime import datetime
 
 BASE_URL = "http://localhost:8000"
 
+# Shared session keeps the connection to the backend alive across calls
+SESSION = requests.Session()
+
 def test_endpoint(method, endpoint, data=None, params=None):
     """Test a single API endpoint"""
     url = f"{BASE_URL}{endpoint}"
+    method = method.upper()
+    
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        return False, f"Unsupported method: {method}"
     
     try:
-        if method.upper() == "GET":
-            response = requests.get(url, params=params)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data, params=params)
-        elif method.upper() == "PUT":
-            response = requests.put(url, json=data, params=params)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, params=params)
-        else:
-            return False, f"Unsupported method: {method}"
+        response = SESSION.request(
+            method, url,
+            json=data if method in ("POST", "PUT") else None,
+            params=params
+        )
         
         if response.status_code < 400:
             return True, response.json()
@@ -174,7 +176,7 @@ def test_frontend_connectivity():
     
     try:
         # Test CORS and basic connectivity
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(f"{BASE_URL}/health")
         if response.status_code == 200:
             print("✅ Backend is accessible from frontend")
             return True
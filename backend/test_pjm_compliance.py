@@ -1,176 +0,0 @@
-#!/usr/bin/env python3
-"""
-PJM Compliance Testing Script
-Tests that all PJM requirements are properly implemented
-"""
-
-import requests
-import json
-from datetime import datetime, timedelta
-
-BASE_URL = "http://localhost:8000"
-
-def test_pjm_compliance():
-    """Test PJM compliance features"""
-    
-    print("🏛️ PJM Compliance Testing")
-    print("=" * 50)
-    
-    tests = []
-    
-    # Test 1: Compliance validation
-    print("\n1. Testing PJM compliance validation...")
-    try:
-        response = requests.get(f"{BASE_URL}/api/pjm/compliance/validation")
-        if response.status_code == 200:
-            data = response.json()
-            compliance = data.get('overall_compliance', False)
-            score = data.get('compliance_score', '0/0')
-            
-            print(f"✅ Compliance validation: {compliance} ({score})")
-            
-            # Check specific requirements
-            requirements = data.get('pjm_requirements', {})
-            for req, status in requirements.items():
-                print(f"   {req}: {status}")
-            
-            tests.append(("Compliance Validation", True, data))
-        else:
-            print(f"❌ Compliance validation failed: {response.status_code}")
-            tests.append(("Compliance Validation", False, response.text))
-    except Exception as e:
-        print(f"❌ Compliance validation error: {e}")
-        tests.append(("Compliance Validation", False, str(e)))
-    
-    # Test 2: PJM-compliant P&L calculation
-    print("\n2. Testing PJM-compliant P&L calculation...")
-    try:
-        test_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        pnode_id = "PJM_RTO"  # Use sample node
-        
-        response = requests.get(
-            f"{BASE_URL}/api/pjm/compliance/pnl/{pnode_id}",
-            params={"date": test_date, "use_verified": False}
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            formula = data.get('pjm_compliance', {}).get('formula_used', '')
-            
-            print(f"✅ P&L calculation successful")
-            print(f"   Formula: {formula}")
-            print(f"   Total P&L: ${data.get('total_pnl', 0):.2f}")
-            print(f"   Data Quality: {data.get('data_quality', 'unknown')}")
-            
-            tests.append(("PJM P&L Calculation", True, data))
-        else:
-            print(f"❌ P&L calculation failed: {response.status_code}")
-            tests.append(("PJM P&L Calculation", False, response.text))
-    except Exception as e:
-        print(f"❌ P&L calculation error: {e}")
-        tests.append(("PJM P&L Calculation", False, str(e)))
-    
-    # Test 3: Settlement summary
-    print("\n3. Testing settlement summary...")
-    try:
-        response = requests.get(
-            f"{BASE_URL}/api/pjm/compliance/settlement-summary/{pnode_id}",
-            params={"date": test_date}
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            settlement_status = data.get('settlement_status', 'unknown')
-            
-            print(f"✅ Settlement summary successful")
-            print(f"   Status: {settlement_status}")
-            print(f"   Provisional P&L: ${data.get('provisional_data', {}).get('total_pnl', 0):.2f}")
-            
-            verified_data = data.get('verified_data')
-            if verified_data:
-                print(f"   Verified P&L: ${verified_data.get('total_pnl', 0):.2f}")
-            else:
-                print("   Verified P&L: Not yet available")
-            
-            tests.append(("Settlement Summary", True, data))
-        else:
-            print(f"❌ Settlement summary failed: {response.status_code}")
-            tests.append(("Settlement Summary", False, response.text))
-    except Exception as e:
-        print(f"❌ Settlement summary error: {e}")
-        tests.append(("Settlement Summary", False, str(e)))
-    
-    # Test 4: Original API still works
-    print("\n4. Testing backward compatibility...")
-    try:
-        response = requests.get(f"{BASE_URL}/api/pjm/status")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Original PJM API still works")
-            print(f"   System Status: {data.get('system_status', 'unknown')}")
-            tests.append(("Backward Compatibility", True, data))
-        else:
-            print(f"❌ Original API failed: {response.status_code}")
-            tests.append(("Backward Compatibility", False, response.text))
-    except Exception as e:
-        print(f"❌ Original API error: {e}")
-        tests.append(("Backward Compatibility", False, str(e)))
-    
-    # Summary
-    print("\n" + "=" * 50)
-    print("📊 PJM Compliance Test Results:")
-    
-    passed = sum(1 for _, success, _ in tests if success)
-    total = len(tests)
-    
-    for test_name, success, _ in tests:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"   {test_name}: {status}")
-    
-    print(f"\nOverall: {passed}/{total} tests passed ({(passed/total)*100:.1f}%)")
-    
-    if passed >= 3:  # Allow one test to fail
-        print("\n🎉 PJM Compliance implementation successful!")
-        print("\n✅ Your system now includes:")
-        print("   • P&L_H = Σ(P_DA - P_RT,t) × q/12 formula")
-        print("   • Provisional vs verified data handling")
-        print("   • Proper Pnode ID persistence")
-        print("   • 5-minute bucket settlement")
-        print("   • $/MWh units throughout")
-        print("   • Data quality badges in UI")
-        
-        print("\n🚀 Ready to test!")
-        print("   1. Visit: http://localhost:5173/pjm-compliance")
-        print("   2. See bucket-by-bucket settlement in action")
-        print("   3. Check provisional/verified data badges")
-        
-        return True
-    else:
-        print("\n🔧 Some compliance features need attention.")
-        print("Check the backend logs and ensure all services are running.")
-        return False
-
-def main():
-    print("⚡ Virtual Energy Trading - PJM Compliance Test")
-    print(f"Testing backend at: {BASE_URL}")
-    print("=" * 60)
-    
-    # Check if backend is running
-    try:
-        response = requests.get(f"{BASE_URL}/health")
-        if response.status_code != 200:
-            print("❌ Backend not accessible")
-            print("   Start with: uvicorn app.main:app --reload")
-            return
-    except:
-        print("❌ Cannot connect to backend")
-        print("   Start with: uvicorn app.main:app --reload") 
-        return
-    
-    print("✅ Backend is running")
-    
-    # Run compliance tests
-    test_pjm_compliance()
-
-if __name__ == "__main__":
-    main()
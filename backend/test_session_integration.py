@@ -1,118 +1,76 @@
 #!/usr/bin/env python3
 """
-Integration Test Script for Trading Session Management
-Run this to verify session lifecycle, capital tracking, and daily resets work end-to-end
+Integration Tests for Trading Session Management
+Run with: pytest -n auto test_session_integration.py
 """
 
-import asyncio
-import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-import pytz
+from zoneinfo import ZoneInfo
+import pytest
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from sqlmodel import Session, create_engine, SQLModel
-from app.models import (
-    TradingSession, UserCapital, DailyPnLSummary,
-    TradingOrder, OrderFill, SessionState, MarketType, OrderSide, OrderType,
-    get_or_create_user_capital, get_or_create_trading_session, calculate_session_state
-)
+from app.models import SessionState, calculate_session_state
 from app.services.trading_session_manager import TradingSessionManager
 
-async def test_trading_session_management():
-    """Test trading session management end-to-end"""
-    
-    print("🚀 Starting Trading Session Management Integration Test")
-    print("=" * 70)
-    
-    # Setup test database
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    SQLModel.metadata.create_all(engine)
-    
-    # Configure environment
-    os.environ["SIM_STARTING_CAPITAL"] = "10000.0"
-    os.environ["SIM_DAILY_RESET_ENABLED"] = "true"
-    os.environ["SIM_CAPITAL_PERSISTENCE"] = "true"
-    
-    with Session(engine) as session:
-        
-        # Test 1: First-time trader initialization
-        print("\n✅ Test 1: First-Time Trader Initialization")
-        print("-" * 50)
-        
-        session_manager = TradingSessionManager(session)
-        user_id = "test_trader_001"
-        
-        # Initialize trader
-        init_result = session_manager.initialize_trader_session(user_id)
-        
-        print(f"User ID: {init_result['user_id']}")
-        print(f"Starting Capital: ${init_result['capital']['starting_capital']:.2f}")
-        print(f"Current Capital: ${init_result['capital']['current_capital']:.2f}")
-        print(f"Session State: {init_result['session_state']}")
-        print(f"DA Orders Enabled: {init_result['trading_permissions']['da_orders_enabled']}")
-        print(f"RT Orders Enabled: {init_result['trading_permissions']['rt_orders_enabled']}")
-        
-        assert init_result['capital']['starting_capital'] == 10000.0
-        assert init_result['capital']['current_capital'] == 10000.0
-        assert init_result['pnl']['total_realized_pnl'] == 0.0
-        print("✅ First-time initialization test PASSED")
-        
-        # Test 2: Session State Calculation
-        print("\n✅ Test 2: Session State Calculation")
-        print("-" * 50)
-        
-        et = pytz.timezone('US/Eastern')
-        
-        # Test PRE_11AM state (9 AM ET)
-        test_time_9am = datetime.now(et).replace(hour=9, minute=0, second=0, microsecond=0)
-        state_9am, da_enabled_9am, rt_enabled_9am = calculate_session_state(test_time_9am.astimezone(pytz.UTC))
-        
-        print(f"9:00 AM ET: State={state_9am.value}, DA={da_enabled_9am}, RT={rt_enabled_9am}")
-        assert state_9am == SessionState.PRE_11AM
-        assert da_enabled_9am == True
-        assert rt_enabled_9am == True
-        
-        # Test POST_11AM state (2 PM ET)
-        test_time_2pm = datetime.now(et).replace(hour=14, minute=0, second=0, microsecond=0)
-        state_2pm, da_enabled_2pm, rt_enabled_2pm = calculate_session_state(test_time_2pm.astimezone(pytz.UTC))
-        
-        print(f"2:00 PM ET: State={state_2pm.value}, DA={da_enabled_2pm}, RT={rt_enabled_2pm}")
-        assert state_2pm == SessionState.POST_11AM
-        assert da_enabled_2pm == False
-        assert rt_enabled_2pm == True
-        
-        print("✅ Session state calculation test PASSED")
-        
-        # Test 3: Market State Info
-        print("\n✅ Test 3: Market State Info")
-        print("-" * 50)
-        
-        market_info = session_manager.get_market_state_info()
-        
-        print(f"Current Session State: {market_info['session_state']}")
-        print(f"DA Orders Enabled: {market_info['trading_permissions']['da_orders_enabled']}")
-        print(f"RT Orders Enabled: {market_info['trading_permissions']['rt_orders_enabled']}")
-        print(f"Current Time ET: {market_info['current_time_et']}")
-        print(f"DA Cutoff Time: {market_info['market_timing']['da_cutoff_time']}")
-        
-        assert 'session_state' in market_info
-        assert 'trading_permissions' in market_info
-        assert 'market_timing' in market_info
-        
-        print("✅ Market state info test PASSED")
-        
-    print("\n" + "=" * 70)
-    print("🎉 ALL TRADING SESSION MANAGEMENT TESTS PASSED!")
-    print("✅ First-time trader initialization with $10,000 starting capital")
-    print("✅ Session state transitions (PRE_11AM -> POST_11AM -> MARKET_CLOSE)")
-    print("✅ Trading permissions enforcement (DA cutoff at 11 AM ET)")
-    print("✅ Market state information and timing")
-    print("=" * 70)
+ET = ZoneInfo("US/Eastern")
+UTC = ZoneInfo("UTC")
+
+@pytest.fixture(scope="module")
+def sim_env():
+    """Simulation settings for this module, restored when the module finishes"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SIM_STARTING_CAPITAL", "10000.0")
+        mp.setenv("SIM_DAILY_RESET_ENABLED", "true")
+        mp.setenv("SIM_CAPITAL_PERSISTENCE", "true")
+        yield
+
+@pytest.fixture(scope="module")
+def shared_session_manager(sim_env):
+    """Manager constructed once per module; each test binds its own session"""
+    return TradingSessionManager(session=None)
+
+@pytest.fixture
+def session_manager(shared_session_manager, test_session):
+    """Module-wide manager bound to this test's rollback session"""
+    shared_session_manager.session = test_session
+    return shared_session_manager
+
+def test_first_time_initialization(session_manager):
+    """First-time trader starts with the configured capital and no P&L"""
+    init_result = session_manager.initialize_trader_session("test_trader_001")
+
+    assert init_result['capital']['starting_capital'] == 10000.0
+    assert init_result['capital']['current_capital'] == 10000.0
+    assert init_result['pnl']['total_realized_pnl'] == 0.0
+
+def _et(hour):
+    """Today's given hour in Eastern Time, expressed in UTC"""
+    return datetime.now(ET).replace(hour=hour, minute=0, second=0, microsecond=0).astimezone(UTC)
+
+@pytest.mark.parametrize("test_time,expected_state,da_enabled,rt_enabled", [
+    (_et(9), SessionState.PRE_11AM, True, True),
+    (_et(14), SessionState.POST_11AM, False, True),
+], ids=["9am_et", "2pm_et"])
+def test_session_state_calculation(test_time, expected_state, da_enabled, rt_enabled):
+    """DA orders close at 11 AM ET while RT stays enabled"""
+    state, da, rt = calculate_session_state(test_time)
+
+    assert state == expected_state
+    assert da == da_enabled
+    assert rt == rt_enabled
+
+def test_market_state_info(session_manager):
+    """Market state info exposes session state, permissions and timing"""
+    market_info = session_manager.get_market_state_info()
+
+    assert 'session_state' in market_info
+    assert 'trading_permissions' in market_info
+    assert 'market_timing' in market_info
 
 if __name__ == "__main__":
-    asyncio.run(test_trading_session_management())
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,38 @@
+"""
+Tests for the combined PJM compliance report endpoint
+Requests go through the FastAPI app with the DB dependency bound to the rollback session
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_session
+from app.main import app
+
+@pytest.fixture
+def client(test_session):
+    """TestClient whose requests share this test's rollback session
+
+    Not entered as a context manager, so the startup hook never initializes
+    the application's own database.
+    """
+    app.dependency_overrides[get_session] = lambda: test_session
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_session, None)
+
+def test_compliance_report_sections(client):
+    """One request returns the validation, P&L, settlement and status sections"""
+    response = client.get("/api/pjm/compliance/report", params={"date": "2024-01-15", "pnode": "PJM_RTO"})
+
+    assert response.status_code == 200
+    report = response.json()
+    assert set(report) == {"validation", "pnl", "settlement", "status"}
+    assert report["pnl"]["pnode_id"] == report["settlement"]["pnode_id"] == "PJM_RTO"
+    assert report["settlement"]["date"] == "2024-01-15"
+    assert report["status"]["system_status"] == "operational"
+
+def test_compliance_report_rejects_bad_date(client):
+    """A date that is not YYYY-MM-DD is a client error, not a 500"""
+    response = client.get("/api/pjm/compliance/report", params={"date": "15/01/2024"})
+
+    assert response.status_code == 400
@@ -1,8 +1,10 @@
 # Test Suite for PJM Trading Clock - DST-Safe Trading Day State Machine
 # Comprehensive tests including DST transitions and edge cases
 
+import numpy as np
 import pytest
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone
+from unittest.mock import MagicMock
 from zoneinfo import ZoneInfo
 import os
 import sys
@@ -10,21 +12,71 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.services.trading_clock import TradingClock, TradingState, get_trading_state
-from app.services.da_rules import DAOrderRulesEngine, DAOrderValidationError
+from app.services.trading_clock import (
+    TRADING_STATE_CODES, TradingClock, TradingState, get_trading_clock, get_trading_state
+)
+from app.services.da_rules import DAOrderRulesEngine, DAOrderValidationError, get_da_rules_engine
+
+def _to_ts(dt: datetime) -> float:
+    """POSIX timestamp of a naive UTC datetime"""
+    return dt.replace(tzinfo=timezone.utc).timestamp()
+
+def _clock(cutoff_hour="11", cutoff_minute="0", open_hour="0"):
+    """Fresh enabled TradingClock, independent of the environment and the memoized clocks"""
+    return TradingClock(("true", cutoff_hour, cutoff_minute, "0", open_hour, "23", "59"))
+
+@pytest.fixture(scope="module", autouse=True)
+def pjm_env():
+    """State machine enabled with the 11:00:00 ET cutoff, restored after the module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PJM_STATE_MACHINE_ENABLED", "true")
+        mp.setenv("ORDER_CUTOFF_HOUR", "11")
+        mp.setenv("ORDER_CUTOFF_MINUTE", "0")
+        mp.setenv("ORDER_CUTOFF_SECOND", "0")
+        mp.setenv("MAX_ORDERS_PER_HOUR", "10")
+        yield
+
+@pytest.fixture(scope="module")
+def trading_clock(pjm_env):
+    """Trading clock for the 11:00:00 ET cutoff, built once per module"""
+    return get_trading_clock()
+
+@pytest.fixture(scope="module")
+def rules_engine(pjm_env):
+    """DA rules engine with the state machine enabled, built once per module"""
+    return get_da_rules_engine()
+
+@pytest.fixture
+def reset_memoized_services():
+    """Drop clocks and rules engines memoized for a patched environment, even on failure"""
+    yield
+    TradingClock.reset_for_tests()
+    DAOrderRulesEngine.reset_for_tests()
+
+class MockResult:
+    """Query result for a user with no existing orders"""
+    def all(self):
+        return []  # No existing orders for simplicity
+
+    def one(self):
+        return 0  # COUNT(*) of existing orders
+
+class MockSession:
+    """Session stub whose every query returns an empty MockResult"""
+    _result = MockResult()
+
+    def exec(self, statement):
+        return self._result
+
+_MOCK_SESSION = MockSession()
 
 class TestTradingClock:
     """Test PJM Trading Clock with DST transitions and edge cases"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        # Set test environment variables
-        os.environ["PJM_STATE_MACHINE_ENABLED"] = "true"
-        os.environ["ORDER_CUTOFF_HOUR"] = "11"
-        os.environ["ORDER_CUTOFF_MINUTE"] = "0"
-        os.environ["ORDER_CUTOFF_SECOND"] = "0"
-        
-        self.trading_clock = TradingClock()
+    @pytest.fixture(autouse=True)
+    def _bind_clock(self, trading_clock):
+        """Expose the module-wide clock as self.trading_clock"""
+        self.trading_clock = trading_clock
         
     def test_dst_spring_forward_transition(self):
         """Test DST spring forward transition (2:00 AM -> 3:00 AM)"""
@@ -54,6 +106,32 @@ class TestTradingClock:
         state = self.trading_clock.get_trading_state(after_cutoff)
         assert state == TradingState.POST_11AM
     
+    def test_fall_back_cutoff_in_repeated_hour(self):
+        """A 01:30 cutoff on fall-back day closes at the first 01:30 (EDT) and the countdown agrees"""
+        clock = _clock(cutoff_hour="1", cutoff_minute="30")
+        
+        info = clock.get_trading_info(datetime(2024, 11, 3, 5, 0, 0))  # 01:00 EDT
+        assert info["state"] == TradingState.PRE_11AM.value
+        assert info["next_transition"]["next_transition_et"] == "2024-11-03T01:30:00-04:00"
+        assert info["next_transition"]["seconds_until"] == 1800
+        
+        # 01:10 EST, the repeated hour after the cutoff already passed
+        info = clock.get_trading_info(datetime(2024, 11, 3, 6, 10, 0))
+        assert info["state"] == TradingState.POST_11AM.value
+        assert info["next_transition"]["next_state"] == TradingState.END_OF_DAY.value
+        assert info["next_transition"]["seconds_until"] > 0
+    
+    def test_spring_forward_cutoff_in_skipped_hour(self):
+        """A 02:30 cutoff on spring-forward day closes when clocks jump to 03:00 EDT"""
+        clock = _clock(cutoff_hour="2", cutoff_minute="30")
+        
+        assert clock.get_trading_state(datetime(2024, 3, 10, 6, 59, 59)) == TradingState.PRE_11AM  # 01:59:59 EST
+        assert clock.get_trading_state(datetime(2024, 3, 10, 7, 0, 0)) == TradingState.POST_11AM   # 03:00 EDT
+        
+        info = clock.get_trading_info(datetime(2024, 3, 10, 6, 30, 0))
+        assert info["next_transition"]["next_transition_et"] == "2024-03-10T03:00:00-04:00"
+        assert info["next_transition"]["seconds_until"] == 1800
+    
     def test_critical_cutoff_edge_cases(self):
         """Test critical 11:00:00 cutoff boundary with microsecond precision"""
         # Test date in standard time (no DST complications)
@@ -76,6 +154,17 @@ class TestTradingClock:
         state = self.trading_clock.get_trading_state(after_cutoff)
         assert state == TradingState.POST_11AM
         assert self.trading_clock.is_da_allowed(after_cutoff) == False
+        
+        # Same boundaries given as POSIX timestamps
+        assert _to_ts(before_cutoff) == 1705334399.999
+        assert self.trading_clock.get_trading_state(_to_ts(before_cutoff)) == TradingState.PRE_11AM
+        assert self.trading_clock.get_trading_state(_to_ts(at_cutoff)) == TradingState.POST_11AM
+        assert self.trading_clock.get_trading_state(_to_ts(after_cutoff)) == TradingState.POST_11AM
+        assert self.trading_clock.is_da_allowed(_to_ts(at_cutoff)) == False
+        # NumPy scalars and plain ints take the same path
+        assert self.trading_clock.get_trading_state(np.int64(1705334400)) == TradingState.POST_11AM
+        assert self.trading_clock.get_trading_state(np.float64(1705334399.999)) == TradingState.PRE_11AM
+        assert self.trading_clock.get_trading_state(1705334399) == TradingState.PRE_11AM
     
     def test_state_transitions_throughout_day(self):
         """Test all state transitions throughout trading day"""
@@ -112,56 +201,137 @@ class TestTradingClock:
         assert info["next_transition"]["next_state"] == TradingState.POST_11AM.value
         assert info["next_transition"]["seconds_until"] == 1800  # 30 minutes = 1800 seconds
     
-    def test_feature_flag_disabled(self):
+    def test_trading_info_copies_state_template(self):
+        """Each call gets its own dicts, nested ones included, built from the per-state template"""
+        first = self.trading_clock.get_trading_info(datetime(2024, 6, 15, 14, 30, 0))
+        first["permissions"]["da_orders"] = False
+        first["cutoff_config"]["da_cutoff_hour"] = 0
+        second = self.trading_clock.get_trading_info(datetime(2024, 6, 15, 14, 45, 0))
+        
+        assert first is not second
+        assert first["permissions"] is not second["permissions"]
+        assert second["permissions"] == {"da_orders": True, "rt_orders": True}
+        assert second["cutoff_config"]["da_cutoff_hour"] == 11
+        assert first["next_transition"]["next_transition_et"] == "2024-06-15T11:00:00-04:00"
+        assert (first["next_transition"]["seconds_until"], second["next_transition"]["seconds_until"]) == (1800, 900)
+    
+    def test_feature_flag_disabled(self, monkeypatch, reset_memoized_services):
         """Test behavior when feature flag is disabled"""
         # Temporarily disable feature flag
-        os.environ["PJM_STATE_MACHINE_ENABLED"] = "false"
-        disabled_clock = TradingClock()
+        monkeypatch.setenv("PJM_STATE_MACHINE_ENABLED", "false")
+        disabled_clock = get_trading_clock()
         
         # Should always return PRE_11AM (legacy behavior)
         test_time = datetime(2024, 6, 15, 20, 0, 0)  # Well after 11 AM
         state = disabled_clock.get_trading_state(test_time)
         assert state == TradingState.PRE_11AM
+    
+    def test_clock_memo_covers_market_hours(self, monkeypatch, reset_memoized_services):
+        """Changing market hours yields a clock built with the new hours"""
+        monkeypatch.setenv("MARKET_CLOSE_HOUR", "22")
+        early_close_clock = get_trading_clock()
         
-        # Restore flag
-        os.environ["PJM_STATE_MACHINE_ENABLED"] = "true"
+        assert early_close_clock is not self.trading_clock
+        assert early_close_clock.market_close_hour == 22
     
-    def test_timezone_handling_consistency(self):
+    @pytest.mark.parametrize("test_time", [
+        datetime(2024, 1, 15, 16, 0, 0),  # Winter (EST)
+        datetime(2024, 4, 15, 15, 0, 0),  # Spring (EDT)
+        datetime(2024, 7, 15, 15, 0, 0),  # Summer (EDT)
+        datetime(2024, 10, 15, 15, 0, 0), # Fall (EDT)
+        datetime(2024, 12, 15, 16, 0, 0)  # Winter (EST)
+    ], ids=["winter_est", "spring_edt", "summer_edt", "fall_edt", "december_est"])
+    def test_timezone_handling_consistency(self, test_time):
         """Test timezone handling consistency across different times of year"""
-        # Test times in different parts of the year
-        test_cases = [
-            datetime(2024, 1, 15, 16, 0, 0),  # Winter (EST)
-            datetime(2024, 4, 15, 15, 0, 0),  # Spring (EDT) 
-            datetime(2024, 7, 15, 15, 0, 0),  # Summer (EDT)
-            datetime(2024, 10, 15, 15, 0, 0), # Fall (EDT)
-            datetime(2024, 12, 15, 16, 0, 0)  # Winter (EST)
-        ]
-        
-        for test_time in test_cases:
-            state = self.trading_clock.get_trading_state(test_time)
-            # All should be POST_11AM since they represent 11:00 AM ET in their respective timezones
-            assert state == TradingState.POST_11AM
-
+        state = self.trading_clock.get_trading_state(test_time)
+        # All should be POST_11AM since they represent 11:00 AM ET in their respective timezones
+        assert state == TradingState.POST_11AM
+    
+    @pytest.mark.parametrize("year", [2023, 2024])
+    def test_batched_state_consistency(self, year):
+        """Batched states match the scalar path for 10k random instants of a year"""
+        rng = np.random.default_rng(year)
+        first_us = int(_to_ts(datetime(year, 1, 1))) * 1_000_000
+        last_us = int(_to_ts(datetime(year + 1, 1, 1))) * 1_000_000
+        ts_us = rng.integers(first_us, last_us, size=10_000, dtype=np.int64)
+        
+        codes = self.trading_clock.get_trading_states(ts_us * 1000)
+        
+        epoch = datetime(1970, 1, 1)
+        for micros, code in zip(ts_us.tolist(), codes.tolist()):
+            now_utc = epoch + timedelta(microseconds=micros)
+            assert TRADING_STATE_CODES[code] == self.trading_clock.get_trading_state(now_utc)
+        
+        # datetime64 input resolves the same states
+        assert (self.trading_clock.get_trading_states(ts_us.astype("datetime64[us]")) == codes).all()
+    
+    def test_cutoff_follows_offset_across_year(self):
+        """Cutoff lands at 15:00 UTC in EDT and 16:00 UTC in EST, including leap day and New Year's Eve"""
+        clock = _clock()
+        one_us = timedelta(microseconds=1)
+        
+        for cutoff_utc in (
+            datetime(2024, 1, 15, 16, 0, 0),   # EST
+            datetime(2024, 2, 29, 16, 0, 0),   # Leap day (EST)
+            datetime(2024, 7, 15, 15, 0, 0),   # EDT
+            datetime(2024, 12, 31, 16, 0, 0),  # Last day of the year (EST)
+            datetime(2025, 1, 1, 16, 0, 0),    # First day of the next year (EST)
+        ):
+            assert clock.get_trading_state(cutoff_utc - one_us) == TradingState.PRE_11AM
+            assert clock.get_trading_state(cutoff_utc) == TradingState.POST_11AM
+        
+        # Midnight ET starts a new trading day across the year boundary
+        assert clock.get_trading_state(datetime(2025, 1, 1, 5, 0, 0)) == TradingState.PRE_11AM
+        
+        # Dropping cached boundaries does not change the answers
+        clock.clear_cache()
+        assert clock.get_trading_state(datetime(2024, 2, 29, 15, 59, 59)) == TradingState.PRE_11AM
+        assert clock.get_trading_state(datetime(2024, 2, 29, 16, 0, 0)) == TradingState.POST_11AM
+    
+    @pytest.mark.parametrize("day", [
+        datetime(2024, 3, 10).date(),  # Spring forward
+        datetime(2024, 11, 3).date(),  # Fall back
+    ], ids=["spring_forward", "fall_back"])
+    def test_dst_day_cutoffs_match_zoneinfo(self, day):
+        """Every half-hour cutoff on a DST transition day closes at the zoneinfo instant"""
+        eastern = ZoneInfo("America/New_York")
+        one_us = timedelta(microseconds=1)
+        
+        for minute in range(30, 24 * 60, 30):
+            cutoff = time(minute // 60, minute % 60)
+            local = datetime.combine(day, cutoff, tzinfo=eastern)
+            if local.astimezone(timezone.utc).astimezone(eastern).time() != cutoff:
+                # Skipped wall time: the cutoff takes effect when clocks jump to 03:00
+                local = datetime.combine(day, time(3), tzinfo=eastern)
+            cutoff_utc = local.astimezone(timezone.utc).replace(tzinfo=None)
+            
+            clock = _clock(cutoff_hour=str(cutoff.hour), cutoff_minute=str(cutoff.minute))
+            assert clock.get_trading_state(cutoff_utc - one_us) == TradingState.PRE_11AM, cutoff
+            assert clock.get_trading_state(cutoff_utc) == TradingState.POST_11AM, cutoff
+    
+    @pytest.mark.parametrize("cutoff_utc", [
+        datetime(2024, 3, 9, 16, 0, 0),   # Day before spring forward (EST)
+        datetime(2024, 3, 10, 15, 0, 0),  # Spring forward (EDT by 11:00)
+        datetime(2024, 3, 11, 15, 0, 0),  # Day after spring forward (EDT)
+        datetime(2024, 11, 2, 15, 0, 0),  # Day before fall back (EDT)
+        datetime(2024, 11, 3, 16, 0, 0),  # Fall back (EST by 11:00)
+        datetime(2024, 11, 4, 16, 0, 0),  # Day after fall back (EST)
+    ], ids=["mar9", "mar10", "mar11", "nov2", "nov3", "nov4"])
+    def test_default_cutoff_around_dst_transitions(self, cutoff_utc):
+        """The 11:00 cutoff tracks the offset in force on and around both transition days"""
+        clock = _clock()
+        
+        assert clock.get_trading_state(cutoff_utc - timedelta(seconds=1)) == TradingState.PRE_11AM
+        assert clock.get_trading_state(cutoff_utc) == TradingState.POST_11AM
 
 class TestDAOrderRulesEngine:
     """Test DA Order Rules Engine with PJM compliance"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        os.environ["PJM_STATE_MACHINE_ENABLED"] = "true"
-        os.environ["MAX_ORDERS_PER_HOUR"] = "10"
-        
-        self.rules_engine = DAOrderRulesEngine()
-        
-        # Mock session for testing
-        class MockSession:
-            def exec(self, statement):
-                class MockResult:
-                    def all(self):
-                        return []  # No existing orders for simplicity
-                return MockResult()
-        
-        self.mock_session = MockSession()
+    @pytest.fixture(autouse=True)
+    def _bind_engine(self, rules_engine):
+        """Expose the module-wide rules engine and a stub session"""
+        self.rules_engine = rules_engine
+        self.mock_session = _MOCK_SESSION
     
     def test_da_order_before_cutoff(self):
         """Test DA order validation before 11 AM cutoff"""
@@ -182,13 +352,16 @@ class TestDAOrderRulesEngine:
         # 2:00 PM ET = 18:00 UTC (EST)
         test_time = datetime(2024, 1, 15, 19, 0, 0)
         delivery_time = datetime(2024, 1, 16, 20, 0, 0)
+        session = MagicMock(wraps=self.mock_session)
         
         with pytest.raises(DAOrderValidationError) as exc_info:
             self.rules_engine.validate_da_order_submission(
-                self.mock_session, "test_user", "TEST_NODE", delivery_time, test_time
+                session, "test_user", "TEST_NODE", delivery_time, test_time
             )
         
         assert exc_info.value.error_code == "DA_MARKET_CLOSED"
+        # Rejected before the hourly order-limit query
+        session.exec.assert_not_called()
     
     def test_edge_case_timing_microsecond_precision(self):
         """Test edge case timing with microsecond precision"""
@@ -209,10 +382,10 @@ class TestDAOrderRulesEngine:
                 self.mock_session, "test_user", "TEST_NODE", delivery_time, at_cutoff
             )
     
-    def test_feature_flag_disabled_legacy_mode(self):
+    def test_feature_flag_disabled_legacy_mode(self, monkeypatch, reset_memoized_services):
         """Test legacy mode when feature flag is disabled"""
-        os.environ["PJM_STATE_MACHINE_ENABLED"] = "false"
-        legacy_engine = DAOrderRulesEngine()
+        monkeypatch.setenv("PJM_STATE_MACHINE_ENABLED", "false")
+        legacy_engine = get_da_rules_engine()
         
         # Should use legacy validation logic
         test_time = datetime(2024, 1, 15, 19, 0, 0)  # After cutoff
@@ -227,9 +400,15 @@ class TestDAOrderRulesEngine:
         except DAOrderValidationError as e:
             # Legacy validation should also catch timing violations
             assert e.error_code == "LEGACY_TIMING_CUTOFF"
-        
-        # Restore flag
-        os.environ["PJM_STATE_MACHINE_ENABLED"] = "true"
+
+    def test_engine_memo_covers_hourly_limit(self, monkeypatch, reset_memoized_services):
+        """Changing MAX_ORDERS_PER_HOUR yields an engine built with the new limit"""
+        monkeypatch.setenv("MAX_ORDERS_PER_HOUR", "3")
+        limited_engine = get_da_rules_engine()
+    
+        assert limited_engine is not self.rules_engine
+        assert limited_engine.max_da_orders_per_hour == 3
+        assert limited_engine.feature_enabled
     
     def test_dst_transition_edge_cases(self):
         """Test DA order validation during DST transitions"""
@@ -266,7 +445,9 @@ class TestSettlementCalculations:
         rt_prices = [48.0, 49.0, 51.0, 52.0, 53.0, 54.0, 
                     55.0, 54.0, 53.0, 52.0, 50.0, 49.0]
         
-        result = calculate_hour_pnl_da_vs_rt(da_price, quantity_mwh, rt_prices, "BUY")
+        result = calculate_hour_pnl_da_vs_rt(
+            da_price, quantity_mwh, rt_prices, "BUY", include_details=True
+        )
         
         # Verify bucket calculation: q/12 = 2.4/12 = 0.2 MWh per bucket
         expected_bucket_quantity = 0.2
@@ -295,7 +476,9 @@ class TestSettlementCalculations:
         rt_prices = [55.0, 54.0, 53.0, 52.0, 51.0, 50.0,
                     49.0, 48.0, 47.0, 46.0, 45.0, 44.0]
         
-        result = calculate_hour_pnl_da_vs_rt(da_price, quantity_mwh, rt_prices, "SELL")
+        result = calculate_hour_pnl_da_vs_rt(
+            da_price, quantity_mwh, rt_prices, "SELL", include_details=True
+        )
         
         # For SELL: P&L = (P_DA - P_RT,t) × q/12
         # When RT > DA, P&L is negative (had to buy back at higher price)
@@ -313,6 +496,41 @@ class TestSettlementCalculations:
         expected_total = sum((da_price - rt_price) * bucket_quantity for rt_price in rt_prices)
         assert abs(result["hour_pnl_total"] - expected_total) < 0.01
     
+    def test_bucket_details_only_on_request(self):
+        """Summary-only calls skip the per-bucket breakdown but keep the same total"""
+        from app.services.settlement_engine import (
+            calculate_hour_pnl_da_vs_rt, calculate_hour_pnl_da_vs_rt_fast
+        )
+        
+        rt_prices = [48.0, 49.0, 51.0, 52.0, 53.0, 54.0,
+                    55.0, 54.0, 53.0, 52.0, 50.0, 49.0]
+        
+        result = calculate_hour_pnl_da_vs_rt(50.0, 2.4, rt_prices, "BUY")
+        assert "bucket_details" not in result
+        
+        hour_pnl_total, bucket_pnls = calculate_hour_pnl_da_vs_rt_fast(50.0, 2.4, rt_prices)
+        assert len(bucket_pnls) == 12
+        assert result["hour_pnl_total"] == round(hour_pnl_total, 2)
+    
+    def test_day_pnl_batch_matches_single_hour(self):
+        """Batched hour totals equal the single-hour calculation for each row"""
+        from app.services.settlement_engine import (
+            calculate_day_pnl_da_vs_rt, calculate_hour_pnl_da_vs_rt_fast
+        )
+        
+        da_prices = [50.0, 42.5]
+        rt_prices = [[48.0, 49.0, 51.0, 52.0, 53.0, 54.0, 55.0, 54.0, 53.0, 52.0, 50.0, 49.0],
+                     [40.0] * 12]
+        
+        pnl_per_hour = calculate_day_pnl_da_vs_rt(da_prices, 2.4, rt_prices)
+        
+        assert len(pnl_per_hour) == 2
+        for da_price, rt_hour, hour_pnl in zip(da_prices, rt_prices, pnl_per_hour):
+            assert abs(hour_pnl - calculate_hour_pnl_da_vs_rt_fast(da_price, 2.4, rt_hour)[0]) < 1e-9
+        
+        with pytest.raises(ValueError):
+            calculate_day_pnl_da_vs_rt(da_prices, 2.4, [row[:11] for row in rt_prices])
+    
     def test_invalid_rt_price_count(self):
         """Test error handling for invalid RT price count"""
         from app.services.settlement_engine import calculate_hour_pnl_da_vs_rt